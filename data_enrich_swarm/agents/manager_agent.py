@@ -2,24 +2,31 @@
 
 from swarm import Agent
 from agents.worker_agent import WorkerAgent
-from utils.csv_handler import read_csv, write_csv
-from config import CHUNK_SIZE
+from utils.csv_handler import read_data, write_data, is_columnar, ColumnarWriter
+from utils.tracer import tracer
+from utils.entity_store import EntityStore
+from config import CHUNK_SIZE, ENTITY_STORE_MAX_AGE_DAYS
 import logging
 import pandas as pd
-from typing import Dict
+from typing import Any, Dict, Optional, Set, Tuple
 from pydantic import PrivateAttr
 import ast  # Import ast for safe evaluation
 
 
 class ManagerAgent(Agent):
     # Define the expected fields with type annotations
+    swarm: Any = None
     input_csv: str
     output_csv: str
     worker_model: str
+    entity_store_path: Optional[str] = None
 
     # Define private attributes
     _data: pd.DataFrame = PrivateAttr(default=None)
     _workers: Dict[str, WorkerAgent] = PrivateAttr(default_factory=dict)
+    _store: Optional[EntityStore] = PrivateAttr(default=None)
+    _cached: Set[Tuple[str, str]] = PrivateAttr(default_factory=set)
+    _writer: Optional[ColumnarWriter] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -29,13 +36,23 @@ class ManagerAgent(Agent):
         input_csv: str,
         output_csv: str,
         worker_model: str,
+        entity_store_path: Optional[str] = None,
     ):
-        super().__init__(name=name, swarm=swarm, model=model)
-        self.input_csv = input_csv
-        self.output_csv = output_csv
-        self.worker_model = worker_model
+        # Pass every field to the pydantic constructor so validation succeeds
+        super().__init__(
+            name=name,
+            swarm=swarm,
+            model=model,
+            input_csv=input_csv,
+            output_csv=output_csv,
+            worker_model=worker_model,
+            entity_store_path=entity_store_path,
+        )
         self._data = None
         self._workers = {}
+        self._store = None
+        self._cached = set()
+        self._writer = None
         logging.info(
             f"Initialized ManagerAgent with input: {input_csv}, output: {output_csv}"
         )
@@ -44,16 +61,64 @@ class ManagerAgent(Agent):
         """
         Executes the data enrichment process. It reads the input data, creates
         worker agents, distributes work among them, and saves the enriched data to an output file.
+        Cells already known to the entity store are filled first and are not scheduled.
         """
         try:
-            self._data = read_csv(self.input_csv)  # Read input CSV into a DataFrame
+            self._data = read_data(self.input_csv)  # Read input file into a DataFrame
+            if self.entity_store_path:
+                if self._data.index.name == "Company Name":
+                    self._store = EntityStore(self.entity_store_path)
+                    self.fill_from_store()  # Reuse fresh values from previous runs
+                else:
+                    # Without company names the rows would be keyed by row number
+                    logging.warning(
+                        "'Company Name' column not found. Running without the entity store."
+                    )
             self.create_worker_agents()  # Create worker agents for each column
             self.distribute_work()  # Distribute work to worker agents
-            self.save_results()  # Save the enriched data to the output CSV
+            self.save_results()  # Save the enriched data to the output file
             logging.info("Data enrichment process completed successfully")
         except Exception as e:
             logging.error(f"Error during the run process: {e}")
             raise
+        finally:
+            if self._store:
+                self._store.close()
+                self._store = None
+            if self._writer:
+                self._writer.close()
+                self._writer = None
+
+    def fill_from_store(self):
+        """
+        Fills cells from the entity store in bulk, for values fetched within
+        ENTITY_STORE_MAX_AGE_DAYS. Filled cells are skipped by distribute_work.
+        """
+        try:
+            columns = self._data.columns[1:]  # Only the columns that get workers
+            with tracer.span("fill_from_store", category="entity_store"):
+                found = self._store.get_fresh(
+                    self._data.index.tolist(), list(columns), ENTITY_STORE_MAX_AGE_DAYS
+                )
+                for column in columns:
+                    values = {
+                        company: value
+                        for (company, attribute), value in found.items()
+                        if attribute == column
+                    }
+                    if values:
+                        # Map over the index so duplicated company names get the same value
+                        stored = pd.Series(
+                            self._data.index.map(values), index=self._data.index
+                        )
+                        self._data[column] = stored.fillna(self._data[column]).astype(
+                            self._data[column].dtype
+                        )
+            self._cached = set(found)
+            logging.info(f"Filled {len(found)} cells from the entity store")
+        except Exception as e:
+            logging.error(f"Error filling data from the entity store: {e}")
+            raise
 
     def create_worker_agents(self):
         """
@@ -79,8 +144,12 @@ class ManagerAgent(Agent):
         """
         Distributes chunks of companies to each worker agent for processing.
         Each chunk is processed by all worker agents, and results are collected.
+        For Parquet and Arrow outputs, each finished chunk is appended to the file
+        through a ColumnarWriter, which groups the rows into Parquet row groups.
         """
         try:
+            if is_columnar(self.output_csv):
+                self._writer = ColumnarWriter(self.output_csv)
             companies = self._data.index.tolist()  # List of company indices
             total_chunks = (len(companies) + CHUNK_SIZE - 1) // CHUNK_SIZE
             for i in range(0, len(companies), CHUNK_SIZE):
@@ -90,12 +159,28 @@ class ManagerAgent(Agent):
                     f"Processing chunk {chunk_number} of {total_chunks}"
                 )
                 for column, worker in self._workers.items():
+                    # Only schedule the cells that were not filled from the entity store
+                    rows = [
+                        i + offset
+                        for offset, company in enumerate(chunk)
+                        if (company, column) not in self._cached
+                    ]
+                    if not rows:
+                        continue
+                    pending = [companies[row] for row in rows]
                     try:
-                        results = worker.process_chunk(chunk)  # Process chunk with worker
+                        with tracer.span(
+                            "process_chunk", chunk=chunk_number, column=column
+                        ):
+                            results = worker.process_chunk(pending)  # Process chunk with worker
                         self.update_data(results, column)  # Update data with results
                     except Exception as e:
                         logging.error(f"Error processing column {column}: {e}")
-                        self.handle_worker_failure(column)
+                        self.handle_worker_failure(column, rows)
+                if self._writer:
+                    with tracer.span("append_row_group", category="dataframe", chunk=chunk_number):
+                        # Slice by position so duplicated company names are written once
+                        self._writer.append(self._data.iloc[i : i + CHUNK_SIZE])
         except Exception as e:
             logging.error(f"Error distributing work: {e}")
             raise
@@ -109,20 +194,48 @@ class ManagerAgent(Agent):
             column (str): The column name to update in the DataFrame.
         """
         try:
-            parsed_results = ast.literal_eval(results)  # Safely evaluate the string
-            for company, value in parsed_results:
-                self._data.loc[company, column] = value  # Update DataFrame with results
+            with tracer.span("update_data", category="dataframe", column=column):
+                parsed_results = ast.literal_eval(results)  # Safely evaluate the string
+                for company, value in parsed_results:
+                    self._data.loc[company, column] = value  # Update DataFrame with results
+            if self._store:
+                self.store_results(parsed_results, column)
             logging.info(f"Updated data for column: {column}")
         except Exception as e:
             logging.error(f"Error updating data for column {column}: {e}")
             raise
 
+    def store_results(self, parsed_results, column):
+        """
+        Writes new results back to the entity store so later runs can reuse them.
+        Per-company errors returned by the worker are not stored.
+
+        Args:
+            parsed_results (list): Tuples of (company, value) from a worker agent.
+            column (str): The column the results belong to.
+        """
+        records = [
+            (company, column, value)
+            for company, value in parsed_results
+            if not str(value).startswith("Error:")
+        ]
+        if records:
+            with tracer.span("store_results", category="entity_store", column=column):
+                self._store.put_many(
+                    records, sources=["tavily", "perplexity", self.worker_model]
+                )
+
     def save_results(self):
         """
-        Saves the enriched data to the output CSV file.
+        Saves the enriched data to the output file. Columnar outputs were already
+        written chunk by chunk, so only the file footer is finalised here.
         """
         try:
-            write_csv(self._data, self.output_csv)  # Write DataFrame to CSV
+            if self._writer:
+                self._writer.close()  # Finalise the row groups appended so far
+                self._writer = None
+            else:
+                write_data(self._data, self.output_csv)  # Write DataFrame to the output file
             logging.info(f"Results saved to {self.output_csv}")
         except Exception as e:
             logging.error(f"Error saving results to {self.output_csv}: {e}")
@@ -141,15 +254,18 @@ class ManagerAgent(Agent):
         logging.error(f"Error in ManagerAgent: {error}")
         return {"error": str(error), "stage": "management"}
 
-    def handle_worker_failure(self, column):
+    def handle_worker_failure(self, column, rows):
         """
-        Handles the case when a worker agent fails to process a column.
+        Handles the case when a worker agent fails to process a chunk of a column.
+        Only the cells that were sent to the worker are marked as failed, so results
+        already saved, written or taken from the entity store are kept.
 
         Args:
             column (str): The column that failed to process.
+            rows (list): Positions of the rows that were sent to the worker.
         """
         logging.warning(
-            f"Worker agent for column {column} failed. Skipping this column."
+            f"Worker agent for column {column} failed. Skipping {len(rows)} rows."
         )
-        self._data[column] = "Failed to process"
+        self._data.iloc[rows, self._data.columns.get_loc(column)] = "Failed to process"
 
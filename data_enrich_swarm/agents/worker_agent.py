@@ -2,6 +2,7 @@
 
 from swarm import Agent
 from utils.rate_limiter import RateLimiter
+from utils.tracer import tracer
 from config import (
     TAVILY_API_KEY,
     PERPLEXITY_API_KEY,
@@ -57,7 +58,10 @@ class WorkerAgent(Agent):
         results = []
         for company in chunk:
             try:
-                enriched_data = self.enrich_data(company)
+                with tracer.span(
+                    "enrich_data", company=company, column=self.column
+                ):
+                    enriched_data = self.enrich_data(company)
                 results.append((company, enriched_data))
             except Exception as e:
                 logging.error(f"Error processing company {company}: {e}")
@@ -102,8 +106,10 @@ class WorkerAgent(Agent):
         Returns:
             str: The content of the first result from the Tavily API.
         """
-        with self.tavily_limiter:
-            return tavily_search(query)
+        with tracer.span("tavily_search", category="api", column=self.column):
+            with self.tavily_limiter:
+                with tracer.span("tavily_request", category="api"):
+                    return tavily_search(query)
 
     def perplexity_search(self, query):
         """
@@ -115,8 +121,10 @@ class WorkerAgent(Agent):
         Returns:
             str: The content of the first message from the Perplexity API.
         """
-        with self.perplexity_limiter:
-            return perplexity_search(query)
+        with tracer.span("perplexity_search", category="api", column=self.column):
+            with self.perplexity_limiter:
+                with tracer.span("perplexity_request", category="api"):
+                    return perplexity_search(query)
 
     def generate_summary(self, prompt):
         """
@@ -128,9 +136,10 @@ class WorkerAgent(Agent):
         Returns:
             str: The generated summary.
         """
-        response = self.swarm.run(
-            agent=self, messages=[{"role": "user", "content": prompt}]
-        )
+        with tracer.span("generate_summary", category="llm", model=self.model):
+            response = self.swarm.run(
+                agent=self, messages=[{"role": "user", "content": prompt}]
+            )
         return response.messages[-1]["content"]
 
     def handle_error(self, error):
@@ -30,6 +30,13 @@ if not all([OPENAI_API_KEY, TAVILY_API_KEY, PERPLEXITY_API_KEY]):
 
 INPUT_CSV = "data_enrich_swarm/data/fintechs.csv"
 OUTPUT_CSV = "data_enrich_swarm/data/fintechs_enriched.csv"
+# The format is chosen from the extension: .csv, .parquet/.pq or .arrow/.feather
+PARQUET_COMPRESSION = "zstd"  # codec for Parquet column chunks
+PARQUET_ROW_GROUP_SIZE = 10_000  # rows buffered before a Parquet row group is written
+
+# Entity store shared across runs and input files
+ENTITY_STORE_PATH = "data_enrich_swarm/data/entity_store.sqlite"
+ENTITY_STORE_MAX_AGE_DAYS = 30  # stored values older than this are fetched again
 
 # Rate Limiting
 OPENAI_RATE_LIMIT = 60  # requests per minute
@@ -3,6 +3,10 @@
 # main.py
 
 import os
+import io
+import argparse
+import cProfile
+import pstats
 import logging
 from swarm import Swarm
 from config import (
@@ -11,11 +15,16 @@ from config import (
     PERPLEXITY_API_KEY,
     INPUT_CSV,
     OUTPUT_CSV,
+    ENTITY_STORE_PATH,
     DEFAULT_MANAGER_MODEL,
     DEFAULT_WORKER_MODEL,
 )
 from agents.manager_agent import ManagerAgent
 from utils.rate_limiter import RateLimiter
+from utils.tracer import tracer
+
+# Number of functions listed in the --profile summary
+PROFILE_TOP_FUNCTIONS = 25
 
 
 def setup_logging():
@@ -40,15 +49,61 @@ def setup_logging():
     )
 
 
+def parse_args():
+    """
+    Parses the command line options of the application.
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Fintech data enrichment")
+    parser.add_argument(
+        "--trace",
+        metavar="OUT_JSON",
+        help="Record per-cell spans and write them as a Chrome/Perfetto trace file",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run under cProfile and report the hottest functions",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not read from or write to the entity store",
+    )
+    return parser.parse_args()
+
+
+def report_profile(profiler):
+    """
+    Logs and prints the functions with the highest cumulative time.
+
+    Args:
+        profiler (cProfile.Profile): The profiler that wrapped the run.
+    """
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+    logging.info(f"Profile summary:\n{stream.getvalue()}")
+    print(stream.getvalue())
+
+
 def main():
     """
     Main function to execute the data enrichment process.
 
     This function sets up logging, checks for the availability of API keys, initializes the Swarm,
-    and runs the ManagerAgent to process the data.
+    and runs the ManagerAgent to process the data. With --trace the run is recorded as a
+    Chrome trace-event file, and with --profile it is wrapped in cProfile.
     """
+    args = parse_args()
     setup_logging()  # Initialize logging configuration
 
+    if args.trace:
+        tracer.enable()  # Record spans for the whole run
+    profiler = cProfile.Profile() if args.profile else None
+
     try:
         # Ensure all necessary API keys are set
         if not OPENAI_API_KEY or not TAVILY_API_KEY or not PERPLEXITY_API_KEY:
@@ -72,14 +127,24 @@ def main():
             input_csv=INPUT_CSV,
             output_csv=OUTPUT_CSV,
             worker_model=DEFAULT_WORKER_MODEL,
+            entity_store_path=None if args.no_store else ENTITY_STORE_PATH,
         )
         # Run the data enrichment process
         try:
-            manager.run()
+            if profiler:
+                profiler.enable()
+            with tracer.span("ManagerAgent.run", category="run"):
+                manager.run()
         except Exception as e:
             logging.error(f"Error during manager execution: {e}")
             print(f"Error during manager execution: {e}")
             logging.info("Data enrichment process completed successfully")
+        finally:
+            if profiler:
+                profiler.disable()
+                report_profile(profiler)
+            if args.trace:
+                tracer.write(args.trace)  # Export the trace even if the run failed
 
     except ValueError as ve:
         # Log and print configuration errors
@@ -0,0 +1,11 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# config.py refuses to import without API keys; the tests never call the APIs
+for key in ("OPENAI_API_KEY", "TAVILY_API_KEY", "PERPLEXITY_API_KEY"):
+    os.environ.setdefault(key, "test-key")
+
+# The application imports its modules relative to data_enrich_swarm/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
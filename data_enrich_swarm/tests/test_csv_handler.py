@@ -0,0 +1,55 @@
+# tests/test_csv_handler.py
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from utils.csv_handler import STRING_DTYPE, ColumnarWriter, read_columns, read_data, write_data
+
+
+@pytest.fixture
+def enriched():
+    data = pd.DataFrame(
+        {
+            "Company Name": ["Lightyear", "Payoneer", "Lightyear"],
+            "Currencies": ["GBP", "USD", "GBP"],
+            "Partnerships": ["Stripe", None, "Stripe"],
+        }
+    )
+    return data.set_index("Company Name").astype(STRING_DTYPE)
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "arrow"])
+def test_round_trip_keeps_rows_and_string_dtype(tmp_path, enriched, extension):
+    file_path = str(tmp_path / f"enriched.{extension}")
+    write_data(enriched, file_path)
+
+    result = read_data(file_path)
+
+    assert result.equals(enriched)
+    assert (result.dtypes == STRING_DTYPE).all()
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_read_columns_keeps_company_index(tmp_path, enriched, extension):
+    file_path = str(tmp_path / f"enriched.{extension}")
+    write_data(enriched, file_path)
+
+    result = read_columns(file_path, ["Currencies"])
+
+    assert list(result.columns) == ["Currencies"]
+    assert result.index.name == "Company Name"
+    assert result.index.tolist() == ["Lightyear", "Payoneer", "Lightyear"]
+    assert result["Currencies"].tolist() == ["GBP", "USD", "GBP"]
+
+
+def test_parquet_rows_are_buffered_into_row_groups(tmp_path, enriched):
+    file_path = str(tmp_path / "enriched.parquet")
+    writer = ColumnarWriter(file_path, row_group_size=4)
+    for _ in range(5):
+        writer.append(enriched)  # 3 rows per append, as chunks finish
+    writer.close()
+
+    metadata = pq.ParquetFile(file_path).metadata
+    assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [4, 4, 4, 3]
+    assert len(read_data(file_path)) == 15
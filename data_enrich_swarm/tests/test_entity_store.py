@@ -0,0 +1,27 @@
+# tests/test_entity_store.py
+
+from utils.entity_store import EntityStore, canonical_company
+
+
+def test_canonical_company_drops_case_punctuation_and_legal_suffixes():
+    assert canonical_company("Acme Payments Ltd.") == "acme payments"
+    assert canonical_company("ACME payments") == "acme payments"
+
+
+def test_full_text_index_stays_in_sync_after_vacuum(tmp_path):
+    store = EntityStore(str(tmp_path / "entity_store.sqlite"))
+    store.put_many(
+        [("Payoneer", "Currencies", "USD, EUR"), ("Lightyear", "Currencies", "GBP")],
+        sources=["tavily"],
+    )
+    store.put_many([("Payoneer", "Currencies", "open banking")], sources=["tavily"])
+    with store.conn:
+        store.conn.execute("DELETE FROM entities WHERE company = 'Lightyear'")
+    store.conn.execute("VACUUM")
+
+    # Raises sqlite3.DatabaseError if the index no longer matches its rows
+    with store.conn:
+        store.conn.execute("INSERT INTO entities_fts(entities_fts) VALUES ('integrity-check')")
+    assert store.search("open banking") == [("Payoneer", "Currencies", "open banking")]
+    assert store.search("GBP") == []
+    store.close()
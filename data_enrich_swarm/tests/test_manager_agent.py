@@ -0,0 +1,137 @@
+# tests/test_manager_agent.py
+
+import os
+
+import pytest
+
+import agents.manager_agent as manager_module
+from agents.manager_agent import ManagerAgent
+from utils.csv_handler import read_data
+from utils.entity_store import EntityStore
+
+INPUT_ROWS = [
+    "Company Name,API yes/no,Currencies,Partnerships",
+    "Lightyear,,,",
+    "Payoneer,,,",
+    "Lightyear,,,",
+]
+
+
+class FakeWorker:
+    """
+    Stands in for WorkerAgent and records every company it is asked to enrich.
+    """
+
+    calls = []
+
+    def __init__(self, name, swarm, model, column):
+        self.column = column
+
+    def process_chunk(self, chunk):
+        FakeWorker.calls.extend((company, self.column) for company in chunk)
+        return str([(company, f"{company} {self.column}") for company in chunk])
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(manager_module, "WorkerAgent", FakeWorker)
+    FakeWorker.calls = []
+    input_csv = tmp_path / "input.csv"
+    input_csv.write_text("\n".join(INPUT_ROWS) + "\n")
+    return {
+        "input": str(input_csv),
+        "output": str(tmp_path / "output.csv"),
+        "store": str(tmp_path / "entity_store.sqlite"),
+    }
+
+
+def run_manager(paths):
+    manager = ManagerAgent(
+        name="ManagerAgent",
+        swarm=None,
+        model="test-model",
+        input_csv=paths["input"],
+        output_csv=paths["output"],
+        worker_model="test-model",
+        entity_store_path=paths["store"],
+    )
+    manager.run()
+    return read_data(paths["output"])
+
+
+def test_fill_from_store_with_duplicate_company_names(paths):
+    store = EntityStore(paths["store"])
+    store.put_many([("Lightyear", "Currencies", "EUR, GBP")], sources=["tavily"])
+    store.close()
+
+    output = run_manager(paths)
+
+    assert len(output) == 3
+    assert output.loc["Lightyear", "Currencies"].tolist() == ["EUR, GBP", "EUR, GBP"]
+    assert ("Lightyear", "Currencies") not in FakeWorker.calls
+    assert output.loc["Payoneer", "Currencies"] == "Payoneer Currencies"
+
+
+def test_second_run_reuses_the_store(paths):
+    first = run_manager(paths)
+    assert FakeWorker.calls
+
+    FakeWorker.calls = []
+    second = run_manager(paths)
+
+    assert FakeWorker.calls == []
+    assert second.equals(first)
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_columnar_output_has_one_row_per_input_row(paths, monkeypatch, extension):
+    monkeypatch.setattr(manager_module, "CHUNK_SIZE", 2)
+    csv_output = run_manager(paths)
+
+    paths["output"] = paths["output"].replace(".csv", f".{extension}")
+    columnar_output = run_manager(paths)
+
+    assert len(columnar_output) == len(INPUT_ROWS) - 1
+    assert columnar_output.equals(csv_output)
+
+
+def test_store_is_skipped_without_company_names(paths):
+    for companies in (["Acme", "Beta"], ["Zeta", "Omega"]):
+        with open(paths["input"], "w") as input_file:
+            input_file.write("Name,API yes/no,Currencies\n")
+            input_file.writelines(f"{company},,\n" for company in companies)
+        output = run_manager(paths)
+
+    # Rows are keyed by row number, so nothing from the first file may be reused
+    calls = [company for company, column in FakeWorker.calls if column == "Currencies"]
+    assert calls == [0, 1, 0, 1]
+    assert output["Currencies"].tolist() == ["0 Currencies", "1 Currencies"]
+    assert not os.path.exists(paths["store"])
+
+
+class FailingWorker(FakeWorker):
+    """
+    A FakeWorker whose Currencies worker fails on any chunk containing Beta.
+    """
+
+    def process_chunk(self, chunk):
+        if self.column == "Currencies" and "Beta" in chunk:
+            raise RuntimeError("worker failed")
+        return super().process_chunk(chunk)
+
+
+@pytest.mark.parametrize("extension", ["csv", "parquet", "arrow"])
+def test_worker_failure_only_marks_the_failed_chunk(paths, monkeypatch, extension):
+    monkeypatch.setattr(manager_module, "WorkerAgent", FailingWorker)
+    monkeypatch.setattr(manager_module, "CHUNK_SIZE", 1)
+    with open(paths["input"], "w") as input_file:
+        input_file.write("Company Name,API yes/no,Currencies\nAcme,,\nBeta,,\nGamma,,\n")
+    paths["output"] = paths["output"].replace(".csv", f".{extension}")
+
+    output = run_manager(paths)
+
+    assert output["Currencies"].tolist() == [
+        "Acme Currencies",
+        "Failed to process",
+        "Gamma Currencies",
+    ]
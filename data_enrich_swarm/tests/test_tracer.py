@@ -0,0 +1,70 @@
+# tests/test_tracer.py
+
+import json
+import threading
+
+from utils.tracer import Tracer
+
+
+def spans(tracer):
+    return [event for event in tracer.events if event["ph"] == "X"]
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("enrich_data", company="Acme"):
+        pass
+
+    assert tracer.events == []
+
+
+def test_nested_spans_fall_inside_their_parent():
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("enrich_data", company="Acme", column="Currencies"):
+        with tracer.span("tavily_search", category="api"):
+            pass
+
+    child, parent = spans(tracer)  # Spans are recorded as they finish
+    assert (child["name"], parent["name"]) == ("tavily_search", "enrich_data")
+    assert parent["args"] == {"company": "Acme", "column": "Currencies"}
+    assert child["tid"] == parent["tid"]
+    assert parent["ts"] <= child["ts"]
+    assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"]
+
+
+def test_one_thread_name_event_per_thread():
+    tracer = Tracer()
+    tracer.enable()
+
+    def work():
+        for _ in range(3):
+            with tracer.span("enrich_data"):
+                pass
+
+    threads = [threading.Thread(target=work, name=f"worker-{i}") for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    work()
+
+    names = [event for event in tracer.events if event["ph"] == "M"]
+    assert sorted(event["args"]["name"] for event in names) == sorted(
+        ["worker-0", "worker-1", threading.current_thread().name]
+    )
+    assert all(event["name"] == "thread_name" for event in names)
+    assert len(spans(tracer)) == 9
+
+
+def test_write_produces_chrome_trace_json(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("update_data", category="dataframe"):
+        pass
+    file_path = tmp_path / "trace.json"
+
+    tracer.write(str(file_path))
+
+    trace = json.loads(file_path.read_text())
+    assert trace["traceEvents"] == tracer.events
@@ -1,8 +1,174 @@
 # csv_handler.py
 
+import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import logging
-from config import INPUT_CSV, OUTPUT_CSV
+from config import INPUT_CSV, OUTPUT_CSV, PARQUET_COMPRESSION, PARQUET_ROW_GROUP_SIZE
+
+# Arrow-backed string dtype used for every column held in memory
+STRING_DTYPE = pd.StringDtype("pyarrow")
+
+# File extensions mapped to their storage format
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def detect_format(file_path):
+    """
+    Detects the storage format of a data file from its extension.
+
+    Args:
+        file_path (str): The path to the data file.
+
+    Returns:
+        str: One of "csv", "parquet" or "arrow".
+
+    Raises:
+        ValueError: If the extension is not supported.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(
+            f"Unsupported file extension '{extension}' for {file_path}. "
+            f"Supported extensions: {', '.join(FORMATS)}"
+        )
+    return FORMATS[extension]
+
+
+def is_columnar(file_path):
+    """
+    Checks whether a data file is stored in a columnar format (Parquet or Arrow).
+
+    Args:
+        file_path (str): The path to the data file.
+
+    Returns:
+        bool: True for Parquet and Arrow files, False for CSV.
+    """
+    return detect_format(file_path) != "csv"
+
+
+def _prepare(df):
+    """
+    Sets 'Company Name' as the index and stores all columns as Arrow-backed strings.
+
+    Args:
+        df (pd.DataFrame): The DataFrame as read from disk.
+
+    Returns:
+        pd.DataFrame: The prepared DataFrame.
+    """
+    # Check if 'Company Name' column exists
+    if "Company Name" in df.columns:
+        # Set 'Company Name' as index if it exists
+        df.set_index("Company Name", inplace=True)
+    elif df.index.name != "Company Name":
+        logging.warning(
+            "'Company Name' column not found in the input. Using default index."
+        )
+    return df.astype(STRING_DTYPE)
+
+
+def read_data(file_path):
+    """
+    Reads a CSV, Parquet or Arrow file into a pandas DataFrame, choosing the
+    reader from the file extension.
+
+    Args:
+        file_path (str): The path to the file to be read.
+
+    Returns:
+        pd.DataFrame: DataFrame with Arrow-backed string columns.
+
+    Raises:
+        FileNotFoundError: If the file does not exist at the specified path.
+        ValueError: If the extension is not supported or the file cannot be read.
+    """
+    file_format = detect_format(file_path)
+    if file_format == "csv":
+        return read_csv(file_path)
+    try:
+        if file_format == "parquet":
+            table = pq.read_table(file_path, memory_map=True)
+        else:
+            table = feather.read_table(file_path, memory_map=True)
+        return _prepare(table.to_pandas(types_mapper=pd.ArrowDtype))
+    except FileNotFoundError:
+        logging.error(f"The file at {file_path} was not found.")
+        raise
+    except (pa.ArrowInvalid, ValueError) as e:
+        logging.error(f"Error reading {file_format} file at {file_path}: {e}")
+        raise ValueError(f"Error reading {file_format} file at {file_path}: {e}")
+
+
+def read_columns(file_path, columns):
+    """
+    Reads selected columns from a Parquet or Arrow file without parsing the rest.
+
+    The file is memory-mapped, so only the requested column chunks are read. The
+    stored index (normally 'Company Name') is always read as well, so every value
+    stays attached to its company.
+
+    Args:
+        file_path (str): The path to the Parquet or Arrow file.
+        columns (list): The names of the columns to read.
+
+    Returns:
+        pd.DataFrame: DataFrame holding only the requested columns, indexed like the file.
+
+    Raises:
+        ValueError: If the file is not in a columnar format.
+    """
+    file_format = detect_format(file_path)
+    if file_format == "csv":
+        raise ValueError(f"Column reads need a Parquet or Arrow file, got {file_path}")
+    if file_format == "parquet":
+        schema = pq.read_schema(file_path, memory_map=True)
+    else:
+        with pa.memory_map(file_path) as source:
+            schema = pa.ipc.open_file(source).schema
+    # Index columns recorded by pandas; a RangeIndex is stored as metadata, not a column
+    index_columns = [
+        name
+        for name in (schema.pandas_metadata or {}).get("index_columns", [])
+        if isinstance(name, str) and name not in columns
+    ]
+    if file_format == "parquet":
+        table = pq.read_table(file_path, columns=[*index_columns, *columns], memory_map=True)
+    else:
+        table = feather.read_table(file_path, columns=[*index_columns, *columns], memory_map=True)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def write_data(data, file_path):
+    """
+    Writes a pandas DataFrame to a CSV, Parquet or Arrow file, choosing the
+    writer from the file extension.
+
+    Args:
+        data (pd.DataFrame): The DataFrame to be written.
+        file_path (str): The path where the file will be saved.
+
+    Raises:
+        FileNotFoundError: If the directory for the file path does not exist.
+        PermissionError: If there is a permission issue when writing the file.
+        ValueError: If the extension is not supported or the data cannot be written.
+    """
+    if detect_format(file_path) == "csv":
+        write_csv(data, file_path)
+        return
+    writer = ColumnarWriter(file_path)
+    writer.append(data)
+    writer.close()
 
 
 def read_csv(file_path):
@@ -13,7 +179,7 @@ def read_csv(file_path):
         file_path (str): The path to the CSV file to be read.
 
     Returns:
-        pd.DataFrame: DataFrame containing the CSV data.
+        pd.DataFrame: DataFrame containing the CSV data, with Arrow-backed string columns.
 
     Raises:
         FileNotFoundError: If the file does not exist at the specified path.
@@ -22,19 +188,9 @@ def read_csv(file_path):
         ValueError: For any other errors encountered during reading.
     """
     try:
-        # Attempt to read the CSV file
-        df = pd.read_csv(file_path)
-
-        # Check if 'Company Name' column exists
-        if "Company Name" in df.columns:
-            # Set 'Company Name' as index if it exists
-            df.set_index("Company Name", inplace=True)
-        else:
-            logging.warning(
-                "'Company Name' column not found in the CSV. Using default index."
-            )
-
-        return df
+        # Attempt to read the CSV file, keeping every cell as text
+        df = pd.read_csv(file_path, dtype=STRING_DTYPE)
+        return _prepare(df)
     except FileNotFoundError:
         logging.error(f"The file at {file_path} was not found.")
         raise
@@ -79,3 +235,128 @@ def write_csv(data, file_path):
         # Log and raise any other value errors encountered
         logging.error(f"Error writing CSV file at {file_path}: {e}")
         raise ValueError(f"Error writing CSV file at {file_path}: {e}")
+
+
+class ColumnarWriter:
+    """
+    Writes a DataFrame to a Parquet or Arrow file one batch of rows at a time.
+
+    Results can be written as they complete instead of rewriting the whole file.
+    For Parquet, appended rows are buffered and written as one row group once
+    row_group_size rows are pending, so compression and dictionary encoding work
+    on large column chunks. Column chunks are compressed with PARQUET_COMPRESSION.
+    For Arrow, each append is written straight away as a record batch, left
+    uncompressed so readers can memory-map the file without copying.
+
+    Attributes:
+        file_path (str): The path of the output file.
+        file_format (str): Either "parquet" or "arrow".
+        row_group_size (int): Number of rows per Parquet row group.
+        writer: The underlying pyarrow writer, opened on the first append.
+        schema (pa.Schema): The schema of the first batch, shared by every batch.
+    """
+
+    def __init__(self, file_path, row_group_size=PARQUET_ROW_GROUP_SIZE):
+        """
+        Initializes the ColumnarWriter for the given output file.
+
+        Args:
+            file_path (str): The path of the Parquet or Arrow file to write.
+            row_group_size (int): Number of rows per Parquet row group.
+
+        Raises:
+            ValueError: If the file is not in a columnar format.
+        """
+        self.file_path = file_path
+        self.file_format = detect_format(file_path)
+        if self.file_format == "csv":
+            raise ValueError(f"ColumnarWriter needs a Parquet or Arrow file, got {file_path}")
+        self.row_group_size = row_group_size
+        self.writer = None
+        self.schema = None
+        self._sink = None
+        self._pending = []  # Parquet tables not yet written as a row group
+        self._pending_rows = 0
+
+    def append(self, data):
+        """
+        Appends the rows of a DataFrame to the file.
+
+        Args:
+            data (pd.DataFrame): Rows to write; every batch must have the same columns.
+
+        Raises:
+            FileNotFoundError: If the directory for the file path does not exist.
+            PermissionError: If there is a permission issue when writing the file.
+            ValueError: If the rows do not match the schema of the file.
+        """
+        try:
+            table = pa.Table.from_pandas(data.astype(STRING_DTYPE), schema=self.schema)
+            if self.writer is None:
+                self.schema = table.schema  # Later batches are cast to this schema
+                self._open(table.schema)
+            if self.file_format == "parquet":
+                self._pending.append(table)
+                self._pending_rows += table.num_rows
+                if self._pending_rows >= self.row_group_size:
+                    self._flush()
+            else:
+                self.writer.write_table(table)
+        except FileNotFoundError:
+            logging.error(f"The directory for the file path {self.file_path} does not exist.")
+            raise
+        except PermissionError:
+            logging.error(f"Permission denied when writing to {self.file_path}.")
+            raise
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError) as e:
+            logging.error(f"Error writing {self.file_format} file at {self.file_path}: {e}")
+            raise ValueError(f"Error writing {self.file_format} file at {self.file_path}: {e}")
+
+    def _open(self, schema):
+        """
+        Opens the underlying pyarrow writer with the schema of the first batch.
+
+        Args:
+            schema (pa.Schema): The schema shared by every batch.
+        """
+        if self.file_format == "parquet":
+            self.writer = pq.ParquetWriter(
+                self.file_path, schema, compression=PARQUET_COMPRESSION
+            )
+        else:
+            self._sink = pa.OSFile(self.file_path, "wb")
+            self.writer = pa.ipc.new_file(self._sink, schema)
+
+    def _flush(self, final=False):
+        """
+        Writes the buffered Parquet rows as row groups of row_group_size rows.
+
+        Args:
+            final (bool): Also write the last, partly filled row group.
+        """
+        if not self._pending:
+            return
+        table = pa.concat_tables(self._pending)
+        if final:
+            rows = table.num_rows
+        else:
+            # Keep the remainder buffered so only full row groups are written
+            rows = table.num_rows - table.num_rows % self.row_group_size
+        if rows:
+            self.writer.write_table(table.slice(0, rows), row_group_size=self.row_group_size)
+        remainder = table.slice(rows)
+        self._pending = [remainder] if remainder.num_rows else []
+        self._pending_rows = remainder.num_rows
+
+    def close(self):
+        """
+        Writes any buffered rows and finalises the file footer. Nothing is written
+        if no rows were appended.
+        """
+        if self.writer is not None:
+            self._flush(final=True)
+            self.writer.close()
+            self.writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
@@ -0,0 +1,215 @@
+# entity_store.py
+
+import re
+import json
+import time
+import sqlite3
+import logging
+import unicodedata
+from threading import Lock
+
+# Legal suffixes dropped when canonicalising company names
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "ltd", "limited", "llc", "plc", "gmbh", "ag", "sa",
+    "sas", "bv", "nv", "corp", "corporation", "co", "company", "group", "holdings",
+}
+
+# Maximum number of bound parameters per lookup query
+LOOKUP_BATCH_SIZE = 500
+
+
+def canonical_company(name):
+    """
+    Normalises a company name so the same entity matches across input files.
+
+    Args:
+        name (str): The company name as it appears in the input file.
+
+    Returns:
+        str: The canonical key, e.g. "Acme Payments Ltd." -> "acme payments".
+    """
+    text = unicodedata.normalize("NFKC", str(name)).casefold()
+    words = re.sub(r"[^\w\s]", " ", text).split()  # Drop punctuation
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()  # Strip trailing legal suffixes such as "ltd" or "inc"
+    return " ".join(words)
+
+
+class EntityStore:
+    """
+    A persistent SQLite store of enriched values shared across runs and input files.
+
+    Each row holds the value of one attribute (column) for one canonical company,
+    with the sources it was derived from and the time it was fetched. Values are
+    also indexed in an FTS5 table for full-text search.
+
+    Attributes:
+        db_path (str): Path to the SQLite database file.
+        conn (sqlite3.Connection): The open database connection.
+        lock (Lock): A threading lock to ensure thread safety.
+        has_fts (bool): Whether the SQLite build supports the full-text index.
+    """
+
+    def __init__(self, db_path):
+        """
+        Opens the store at the given path, creating the schema if needed.
+
+        Args:
+            db_path (str): Path to the SQLite database file.
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or initialised.
+        """
+        self.db_path = db_path
+        self.lock = Lock()  # Lock to ensure thread safety
+        self.has_fts = True
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._create_schema()
+        except sqlite3.Error as e:
+            logging.error(f"Error opening entity store at {db_path}: {e}")
+            raise
+        logging.info(f"Opened entity store at {db_path}")
+
+    def _create_schema(self):
+        """
+        Creates the entity table and its full-text index.
+        """
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entities (
+                    id INTEGER PRIMARY KEY,
+                    company_key TEXT NOT NULL,
+                    attribute TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    sources TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    UNIQUE (company_key, attribute)
+                )
+                """
+            )
+        try:
+            with self.conn:
+                # External-content FTS index kept in sync by triggers. It is keyed on
+                # the explicit id, which unlike an implicit rowid survives VACUUM
+                self.conn.executescript(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(
+                        company, attribute, value,
+                        content='entities', content_rowid='id'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS entities_ai AFTER INSERT ON entities BEGIN
+                        INSERT INTO entities_fts(rowid, company, attribute, value)
+                        VALUES (new.id, new.company, new.attribute, new.value);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entities_ad AFTER DELETE ON entities BEGIN
+                        INSERT INTO entities_fts(entities_fts, rowid, company, attribute, value)
+                        VALUES ('delete', old.id, old.company, old.attribute, old.value);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entities_au AFTER UPDATE ON entities BEGIN
+                        INSERT INTO entities_fts(entities_fts, rowid, company, attribute, value)
+                        VALUES ('delete', old.id, old.company, old.attribute, old.value);
+                        INSERT INTO entities_fts(rowid, company, attribute, value)
+                        VALUES (new.id, new.company, new.attribute, new.value);
+                    END;
+                    """
+                )
+        except sqlite3.OperationalError as e:
+            self.has_fts = False
+            logging.warning(f"Full-text index unavailable in entity store: {e}")
+
+    def get_fresh(self, companies, attributes, max_age_days):
+        """
+        Looks up the stored values that are recent enough to reuse.
+
+        Args:
+            companies (list): Company names as they appear in the input file.
+            attributes (list): The attribute (column) names to look up.
+            max_age_days (float): Values fetched longer ago than this are ignored.
+
+        Returns:
+            dict: Maps (company, attribute) to the stored value, keyed by the input names.
+        """
+        keys = {}
+        for company in companies:
+            keys.setdefault(canonical_company(company), []).append(company)
+        wanted = set(attributes)
+        cutoff = time.time() - max_age_days * 86400
+        found = {}
+        key_list = list(keys)
+        with self.lock:  # Acquire the lock to ensure thread safety
+            for i in range(0, len(key_list), LOOKUP_BATCH_SIZE):
+                batch = key_list[i : i + LOOKUP_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(batch))
+                rows = self.conn.execute(
+                    f"SELECT company_key, attribute, value FROM entities "
+                    f"WHERE fetched_at >= ? AND company_key IN ({placeholders})",
+                    [cutoff, *batch],
+                ).fetchall()
+                for company_key, attribute, value in rows:
+                    if attribute not in wanted:
+                        continue
+                    for company in keys[company_key]:
+                        found[(company, attribute)] = value
+        return found
+
+    def put_many(self, records, sources):
+        """
+        Inserts or refreshes enriched values in a single transaction.
+
+        Args:
+            records (list): Tuples of (company, attribute, value).
+            sources (list): Names of the sources the values were derived from.
+        """
+        now = time.time()
+        sources_json = json.dumps(sources)
+        rows = [
+            (canonical_company(company), attribute, str(company), str(value), sources_json, now)
+            for company, attribute, value in records
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO entities (company_key, attribute, company, value, sources, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (company_key, attribute) DO UPDATE SET
+                    company = excluded.company,
+                    value = excluded.value,
+                    sources = excluded.sources,
+                    fetched_at = excluded.fetched_at
+                """,
+                rows,
+            )
+
+    def search(self, query, limit=20):
+        """
+        Runs a full-text query over stored companies, attributes and values.
+
+        Args:
+            query (str): An FTS5 match expression, e.g. "open banking".
+            limit (int): Maximum number of rows to return.
+
+        Returns:
+            list: Tuples of (company, attribute, value), best matches first.
+
+        Raises:
+            RuntimeError: If the SQLite build has no FTS5 support.
+        """
+        if not self.has_fts:
+            raise RuntimeError("Full-text search is not available in this SQLite build.")
+        with self.lock:
+            return self.conn.execute(
+                "SELECT company, attribute, value FROM entities_fts "
+                "WHERE entities_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            ).fetchall()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self.lock:
+            self.conn.close()
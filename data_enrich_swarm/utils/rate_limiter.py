@@ -3,6 +3,7 @@
 import time
 from threading import Lock
 import logging
+from utils.tracer import tracer
 
 
 class RateLimiter:
@@ -36,20 +37,22 @@ class RateLimiter:
         Returns:
             None
         """
-        with self.lock:  # Acquire the lock to ensure thread safety
-            now = time.time()  # Get the current time
-            # Filter out calls that are older than 60 seconds
-            self.calls = [t for t in self.calls if now - t < 60]
-            if (
-                len(self.calls) >= self.max_calls
-            ):  # Check if the number of calls has reached the limit
-                sleep_time = 60 - (now - self.calls[0])  # Calculate the time to sleep
-                try:
-                    time.sleep(sleep_time)  # Sleep until a call can be made
-                except Exception as e:
-                    logging.error(f"Error during sleep in rate limiter: {e}")
-                    raise RuntimeError(f"Error during sleep in rate limiter: {e}")
-            self.calls.append(time.time())  # Record the current call time
+        # Time spent waiting for the lock and sleeping is recorded as one span
+        with tracer.span("RateLimiter.__enter__", category="rate_limit"):
+            with self.lock:  # Acquire the lock to ensure thread safety
+                now = time.time()  # Get the current time
+                # Filter out calls that are older than 60 seconds
+                self.calls = [t for t in self.calls if now - t < 60]
+                if (
+                    len(self.calls) >= self.max_calls
+                ):  # Check if the number of calls has reached the limit
+                    sleep_time = 60 - (now - self.calls[0])  # Calculate the time to sleep
+                    try:
+                        time.sleep(sleep_time)  # Sleep until a call can be made
+                    except Exception as e:
+                        logging.error(f"Error during sleep in rate limiter: {e}")
+                        raise RuntimeError(f"Error during sleep in rate limiter: {e}")
+                self.calls.append(time.time())  # Record the current call time
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
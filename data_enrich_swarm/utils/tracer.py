@@ -0,0 +1,115 @@
+# tracer.py
+
+import os
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+
+class Tracer:
+    """
+    A lightweight span recorder that exports Chrome trace-event files.
+
+    Spans are recorded as complete ("X") events with the process and thread ids
+    of the caller, so nested spans on the same thread are shown as a call stack
+    when the file is opened in Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+    Attributes:
+        enabled (bool): Whether spans are currently being recorded.
+        events (list): The recorded trace events.
+        lock (Lock): A threading lock to ensure thread safety.
+    """
+
+    def __init__(self):
+        """
+        Initializes a disabled Tracer with no recorded events.
+        """
+        self.enabled = False  # Tracing is opt-in
+        self.events = []  # List to store the recorded trace events
+        self.lock = threading.Lock()  # Lock to ensure thread safety
+        self._threads = set()  # Thread ids that already have a name event
+
+    def enable(self):
+        """
+        Starts recording spans.
+        """
+        self.enabled = True
+        logging.info("Span tracing enabled")
+
+    @contextmanager
+    def span(self, name, category="enrichment", **args):
+        """
+        Records the duration of the wrapped block as a single span.
+
+        Does nothing when the tracer is disabled.
+
+        Args:
+            name (str): The name of the span.
+            category (str): The category shown for the span in the trace viewer.
+            **args: Extra values attached to the span, e.g. company and column.
+
+        Yields:
+            None
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()  # Start time in nanoseconds
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            thread = threading.current_thread()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",  # Complete event with a duration
+                "ts": start / 1000,  # Trace-event timestamps are in microseconds
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            with self.lock:  # Acquire the lock to ensure thread safety
+                if thread.ident not in self._threads:
+                    # Label the thread track in the viewer
+                    self._threads.add(thread.ident)
+                    self.events.append(
+                        {
+                            "name": "thread_name",
+                            "ph": "M",
+                            "pid": os.getpid(),
+                            "tid": thread.ident,
+                            "args": {"name": thread.name},
+                        }
+                    )
+                self.events.append(event)
+
+    def write(self, file_path):
+        """
+        Writes the recorded spans to a Chrome trace-event JSON file.
+
+        Args:
+            file_path (str): The path where the trace file will be saved.
+
+        Raises:
+            OSError: If the trace file cannot be written.
+        """
+        with self.lock:
+            events = list(self.events)
+        try:
+            with open(file_path, "w", encoding="utf-8") as trace_file:
+                json.dump(
+                    {"traceEvents": events, "displayTimeUnit": "ms"}, trace_file
+                )
+            logging.info(f"Wrote {len(events)} trace events to {file_path}")
+        except OSError as e:
+            logging.error(f"Error writing trace file at {file_path}: {e}")
+            raise
+
+
+# Shared tracer used by the agents and the rate limiter
+tracer = Tracer()